@@ -1,7 +1,8 @@
 import streamlit as st
-import yfinance as yf
 import pandas as pd
-from datetime import datetime
+import numpy as np
+from datetime import datetime, time
+from zoneinfo import ZoneInfo
 
 st.set_page_config(page_title="Index Open vs High", layout="wide")
 
@@ -15,52 +16,83 @@ indices = {
     "^BSESN": "Sensex (India)",
 }
 
-@st.cache_data(ttl=60)
-def get_data(symbols):
-    rows = []
-    for sym, name in symbols.items():
-        ticker = yf.Ticker(sym)
-        info = ticker.info  # has regularMarketOpen/High/Low for live session[web:36][web:40]
-        open_price = info.get("regularMarketOpen")
-        high_price = info.get("regularMarketDayHigh")
-        low_price = info.get("regularMarketDayLow")
-        if open_price is not None and high_price is not None and low_price is not None:
-            gain = high_price - open_price
-            pct_gain = (gain / open_price) * 100 if open_price != 0 else None
-            rows.append({
-                "Index": f"{name} ({sym})",
-                "Open": open_price,
-                "High": high_price,
-                "Low": low_price,
-                "Gain (High - Open)": gain,
-                "% Gain": pct_gain,
-            })
-        else:
-            rows.append({
-                "Index": f"{name} ({sym})",
-                "Open": None,
-                "High": None,
-                "Low": None,
-                "Gain (High - Open)": None,
-                "% Gain": None,
-            })
-    return pd.DataFrame(rows)
+# NSE cash session, used to decide how long fetched quotes stay fresh
+IST = ZoneInfo("Asia/Kolkata")
+MARKET_OPEN = time(9, 15)
+MARKET_CLOSE = time(15, 30)
+
+def is_market_open(now):
+    return now.weekday() < 5 and MARKET_OPEN <= now.time() <= MARKET_CLOSE
+
+def cache_window():
+    # Changes every minute while the market trades, but stays fixed before the
+    # open and after the close so off-hours reruns reuse the cached quotes
+    now = datetime.now(IST)
+    if is_market_open(now):
+        return now.strftime("%Y-%m-%d %H:%M")
+    session = "pre-open" if now.time() < MARKET_OPEN else "closed"
+    return f"{now:%Y-%m-%d} {session}"
+
+@st.cache_data(ttl=3600, max_entries=32)
+def get_data(symbols, window):
+    # window is only part of the cache key, see cache_window()
+    # Imported here so reruns served from the cache skip loading yfinance
+    import yfinance as yf
+
+    # One batched download for every symbol instead of a slow ticker.info call each
+    data = yf.download(
+        " ".join(symbols),
+        period="2d",
+        interval="1d",
+        group_by="ticker",
+        progress=False,
+        threads=True,
+    )
+    fetched = data.columns.get_level_values(0)
+    n = len(symbols)
+    names = [""] * n
+    opens = np.full(n, np.nan)
+    highs = np.full(n, np.nan)
+    lows = np.full(n, np.nan)
+    for i, (sym, name) in enumerate(symbols.items()):
+        names[i] = f"{name} ({sym})"
+        if sym in fetched:
+            bars = data[sym].dropna(subset=["Open", "High", "Low"])
+            if not bars.empty:
+                # Latest daily bar is today's session (or the last one if closed)
+                opens[i] = bars["Open"].iloc[-1]
+                highs[i] = bars["High"].iloc[-1]
+                lows[i] = bars["Low"].iloc[-1]
+    gains = highs - opens
+    pct_gains = gains / np.where(opens == 0, np.nan, opens) * 100
+    return pd.DataFrame({
+        "Index": names,
+        "Open": opens,
+        "High": highs,
+        "Low": lows,
+        "Gain (High - Open)": gains,
+        "% Gain": pct_gains,
+    })
 
 refresh = st.button("Refresh now")
 
-df = get_data(indices)
+df = get_data(indices, cache_window())
 
 if refresh:
     get_data.clear()
-    df = get_data(indices)
+    df = get_data(indices, cache_window())
 
 st.write(f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
-def color_gain(val):
-    if pd.isna(val):
-        return ""
-    color = "green" if val > 0 else "red"
-    return f"color: {color}; font-weight: bold;"  # style rule for positive/negative[web:43][web:45]
+def gain_style(df_sub):
+    # Whole-subset CSS in one pass instead of a Python call per cell
+    arr = df_sub.to_numpy(dtype=np.float64)
+    css = np.where(
+        np.isnan(arr),
+        "",
+        np.where(arr > 0, "color: green; font-weight: bold;", "color: red; font-weight: bold;"),
+    )
+    return pd.DataFrame(css, index=df_sub.index, columns=df_sub.columns)
 
 styled = (
     df.style
@@ -71,7 +103,7 @@ styled = (
         "Gain (High - Open)": "{:.2f}",
         "% Gain": "{:.2f}",
     })
-    .applymap(color_gain, subset=["Gain (High - Open)", "% Gain"])
+    .apply(gain_style, axis=None, subset=["Gain (High - Open)", "% Gain"])
 )
 
 st.dataframe(styled, use_container_width=True)